@@ -6,15 +6,17 @@ This operator watches PaymentJob resources and creates Kubernetes Jobs
 to run payment workers that consume from RabbitMQ and persist to PostgreSQL.
 """
 
-import datetime
+import asyncio
+import functools
 import hashlib
 import logging
 import os
+import time
 
 import kopf
-import kubernetes
-from kubernetes import client
-from kubernetes.client.rest import ApiException
+from kubernetes_asyncio import client, config
+from kubernetes_asyncio.client.api_client import ApiClient
+from kubernetes_asyncio.client.rest import ApiException
 
 # Configure logging
 logging.basicConfig(
@@ -28,7 +30,52 @@ API_GROUP = 'payments.example.com'
 API_VERSION = 'v1alpha1'
 PLURAL = 'paymentjobs'
 
+# Upper bound on concurrent connections kept open to the API server
+API_CONNECTION_POOL_MAXSIZE = 32
 
+# Shared Kubernetes API client, created once on operator startup
+_API_CLIENT = None
+
+# Window used to coalesce bursts of Job events into one status patch
+STATUS_DEBOUNCE_SECONDS = 0.5
+
+# Upper bound of the backoff between retries of a failed status sync
+STATUS_RETRY_MAX_SECONDS = 30.0
+
+# Interval of the fallback resync for PaymentJobs that are still running
+RESYNC_INTERVAL_SECONDS = 60.0
+
+# PaymentJob phases after which nothing is reconciled anymore
+TERMINAL_PHASES = ('Succeeded', 'Failed')
+
+# Latest observed (job name, job status) per (namespace, PaymentJob name)
+_LATEST_JOB_STATUS = {}
+
+# Scheduled status sync tasks per (namespace, PaymentJob name)
+_PENDING_SYNCS = {}
+
+# Last synced PaymentJob phase per (namespace, PaymentJob name)
+_PAYMENTJOB_PHASES = {}
+
+
+def get_api_client() -> ApiClient:
+    """Return the shared Kubernetes API client."""
+    if _API_CLIENT is None:
+        raise RuntimeError("Kubernetes API client is not initialized")
+    return _API_CLIENT
+
+
+async def load_kubernetes_configuration() -> client.Configuration:
+    """Load in-cluster config, falling back to the local kubeconfig."""
+    configuration = client.Configuration()
+    try:
+        config.load_incluster_config(client_configuration=configuration)
+    except config.ConfigException:
+        await config.load_kube_config(client_configuration=configuration)
+    return configuration
+
+
+@functools.lru_cache(maxsize=4096)
 def get_job_name(paymentjob_name: str, namespace: str) -> str:
     """Generate a deterministic Job name from PaymentJob name."""
     # Use a short hash to ensure uniqueness and stay within 63 char limit
@@ -45,7 +92,60 @@ def get_job_name(paymentjob_name: str, namespace: str) -> str:
 
 def get_current_timestamp() -> str:
     """Get current timestamp in ISO format."""
-    return datetime.datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+
+
+def secret_env_var(name: str, secret_name: str, key: str) -> dict:
+    """Build an env var entry sourced from a Secret key."""
+    return {
+        'name': name,
+        'valueFrom': {
+            'secretKeyRef': {'name': secret_name, 'key': key}
+        }
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def build_env_vars(
+    queue_name: str,
+    rabbitmq_host: str,
+    rabbitmq_port: str,
+    rabbitmq_secret: str,
+    postgres_host: str,
+    postgres_port: str,
+    postgres_database: str,
+    postgres_secret: str,
+    max_messages: str = None
+) -> tuple:
+    """Build the worker container env vars.
+    
+    Entries are plain dicts in API (camelCase) form rather than V1EnvVar
+    models, and the result is cached per distinct configuration. The cached
+    tuple is shared between calls and must not be mutated.
+    """
+    env_vars = [
+        # Queue configuration
+        {'name': 'QUEUE_NAME', 'value': queue_name},
+        
+        # RabbitMQ configuration
+        {'name': 'RABBITMQ_HOST', 'value': rabbitmq_host},
+        {'name': 'RABBITMQ_PORT', 'value': rabbitmq_port},
+        secret_env_var('RABBITMQ_USER', rabbitmq_secret, 'username'),
+        secret_env_var('RABBITMQ_PASS', rabbitmq_secret, 'password'),
+        
+        # PostgreSQL configuration
+        {'name': 'POSTGRES_HOST', 'value': postgres_host},
+        {'name': 'POSTGRES_PORT', 'value': postgres_port},
+        {'name': 'POSTGRES_DB', 'value': postgres_database},
+        secret_env_var('POSTGRES_USER', postgres_secret, 'username'),
+        secret_env_var('POSTGRES_PASS', postgres_secret, 'password'),
+    ]
+    
+    # Add MAX_MESSAGES if specified
+    if max_messages is not None:
+        env_vars.append({'name': 'MAX_MESSAGES', 'value': max_messages})
+    
+    return tuple(env_vars)
 
 
 def build_job_spec(
@@ -53,8 +153,8 @@ def build_job_spec(
     namespace: str,
     spec: dict,
     owner_reference: dict
-) -> client.V1Job:
-    """Build a Kubernetes Job spec from PaymentJob spec."""
+) -> dict:
+    """Build a Kubernetes Job manifest (plain dict) from PaymentJob spec."""
     
     job_name = get_job_name(name, namespace)
     
@@ -66,68 +166,18 @@ def build_job_spec(
     rabbitmq = spec['rabbitmq']
     postgres = spec['postgres']
     
-    # Build environment variables
-    env_vars = [
-        # Queue configuration
-        client.V1EnvVar(name='QUEUE_NAME', value=queue_name),
-        
-        # RabbitMQ configuration
-        client.V1EnvVar(name='RABBITMQ_HOST', value=rabbitmq['host']),
-        client.V1EnvVar(
-            name='RABBITMQ_PORT',
-            value=str(rabbitmq.get('port', 5672))
-        ),
-        client.V1EnvVar(
-            name='RABBITMQ_USER',
-            value_from=client.V1EnvVarSource(
-                secret_key_ref=client.V1SecretKeySelector(
-                    name=rabbitmq['secretRef']['name'],
-                    key='username'
-                )
-            )
-        ),
-        client.V1EnvVar(
-            name='RABBITMQ_PASS',
-            value_from=client.V1EnvVarSource(
-                secret_key_ref=client.V1SecretKeySelector(
-                    name=rabbitmq['secretRef']['name'],
-                    key='password'
-                )
-            )
-        ),
-        
-        # PostgreSQL configuration
-        client.V1EnvVar(name='POSTGRES_HOST', value=postgres['host']),
-        client.V1EnvVar(
-            name='POSTGRES_PORT',
-            value=str(postgres.get('port', 5432))
-        ),
-        client.V1EnvVar(name='POSTGRES_DB', value=postgres['database']),
-        client.V1EnvVar(
-            name='POSTGRES_USER',
-            value_from=client.V1EnvVarSource(
-                secret_key_ref=client.V1SecretKeySelector(
-                    name=postgres['secretRef']['name'],
-                    key='username'
-                )
-            )
-        ),
-        client.V1EnvVar(
-            name='POSTGRES_PASS',
-            value_from=client.V1EnvVarSource(
-                secret_key_ref=client.V1SecretKeySelector(
-                    name=postgres['secretRef']['name'],
-                    key='password'
-                )
-            )
-        ),
-    ]
-    
-    # Add MAX_MESSAGES if specified
-    if max_messages is not None:
-        env_vars.append(
-            client.V1EnvVar(name='MAX_MESSAGES', value=str(max_messages))
-        )
+    # Build environment variables (shared across PaymentJobs with the same config)
+    env_vars = build_env_vars(
+        queue_name,
+        rabbitmq['host'],
+        str(rabbitmq.get('port', 5672)),
+        rabbitmq['secretRef']['name'],
+        postgres['host'],
+        str(postgres.get('port', 5432)),
+        postgres['database'],
+        postgres['secretRef']['name'],
+        str(max_messages) if max_messages is not None else None
+    )
     
     # Labels for the Job and Pod
     labels = {
@@ -137,54 +187,54 @@ def build_job_spec(
     }
     
     # Build container spec
-    container = client.V1Container(
-        name='payment-worker',
-        image=image,
-        image_pull_policy='IfNotPresent',
-        env=env_vars,
-        resources=client.V1ResourceRequirements(
-            requests={'cpu': '100m', 'memory': '128Mi'},
-            limits={'cpu': '500m', 'memory': '256Mi'}
-        )
-    )
+    container = {
+        'name': 'payment-worker',
+        'image': image,
+        'imagePullPolicy': 'IfNotPresent',
+        'env': list(env_vars),
+        'resources': {
+            'requests': {'cpu': '100m', 'memory': '128Mi'},
+            'limits': {'cpu': '500m', 'memory': '256Mi'}
+        }
+    }
     
     # Build Pod template spec
-    pod_template = client.V1PodTemplateSpec(
-        metadata=client.V1ObjectMeta(labels=labels),
-        spec=client.V1PodSpec(
-            containers=[container],
-            restart_policy='OnFailure'
-        )
-    )
+    pod_template = {
+        'metadata': {'labels': labels},
+        'spec': {
+            'containers': [container],
+            'restartPolicy': 'OnFailure'
+        }
+    }
     
     # Build Job spec
-    job_spec = client.V1JobSpec(
-        template=pod_template,
-        backoff_limit=3,
-        ttl_seconds_after_finished=300  # Clean up after 5 minutes
-    )
+    job_spec = {
+        'template': pod_template,
+        'backoffLimit': 3,
+        'ttlSecondsAfterFinished': 300  # Clean up after 5 minutes
+    }
     
     # Build Job object
-    job = client.V1Job(
-        api_version='batch/v1',
-        kind='Job',
-        metadata=client.V1ObjectMeta(
-            name=job_name,
-            namespace=namespace,
-            labels=labels,
-            owner_references=[
-                client.V1OwnerReference(
-                    api_version=f"{API_GROUP}/{API_VERSION}",
-                    kind='PaymentJob',
-                    name=owner_reference['name'],
-                    uid=owner_reference['uid'],
-                    controller=True,
-                    block_owner_deletion=True
-                )
+    job = {
+        'apiVersion': 'batch/v1',
+        'kind': 'Job',
+        'metadata': {
+            'name': job_name,
+            'namespace': namespace,
+            'labels': labels,
+            'ownerReferences': [
+                {
+                    'apiVersion': f"{API_GROUP}/{API_VERSION}",
+                    'kind': 'PaymentJob',
+                    'name': owner_reference['name'],
+                    'uid': owner_reference['uid'],
+                    'controller': True,
+                    'blockOwnerDeletion': True
+                }
             ]
-        ),
-        spec=job_spec
-    )
+        },
+        'spec': job_spec
+    }
     
     return job
 
@@ -212,33 +262,58 @@ def update_paymentjob_status(
 
 
 @kopf.on.startup()
-def configure(settings: kopf.OperatorSettings, **_):
+async def configure(settings: kopf.OperatorSettings, **_):
     """Configure operator settings on startup."""
     settings.posting.level = logging.INFO
     settings.watching.server_timeout = 270
     settings.persistence.finalizer = f'{API_GROUP}/finalizer'
+    
+    # Load kubernetes config once and share a single connection pool
+    # across all handlers
+    global _API_CLIENT
+    configuration = await load_kubernetes_configuration()
+    configuration.connection_pool_maxsize = API_CONNECTION_POOL_MAXSIZE
+    _API_CLIENT = ApiClient(configuration)
+    
     logger.info("PaymentJob Operator starting up...")
 
 
+@kopf.on.cleanup()
+async def shutdown(**_):
+    """Cancel pending status syncs and close the shared API client."""
+    global _API_CLIENT
+    for task in list(_PENDING_SYNCS.values()):
+        task.cancel()
+    _PENDING_SYNCS.clear()
+    _LATEST_JOB_STATUS.clear()
+    _PAYMENTJOB_PHASES.clear()
+    
+    if _API_CLIENT is not None:
+        await _API_CLIENT.close()
+        _API_CLIENT = None
+    logger.info("PaymentJob Operator shut down")
+
+
 @kopf.on.create(API_GROUP, API_VERSION, PLURAL)
-def create_paymentjob(spec, name, namespace, uid, logger, **kwargs):
+async def create_paymentjob(spec, name, namespace, uid, logger, **kwargs):
     """Handle PaymentJob creation - create the underlying Kubernetes Job."""
     logger.info(f"Creating PaymentJob: {namespace}/{name}")
     
-    # Load kubernetes config
-    try:
-        kubernetes.config.load_incluster_config()
-    except kubernetes.config.ConfigException:
-        kubernetes.config.load_kube_config()
+    # Forget the phase of a previous PaymentJob with the same name
+    _PAYMENTJOB_PHASES.pop((namespace, name), None)
     
-    batch_api = client.BatchV1Api()
-    custom_api = client.CustomObjectsApi()
+    batch_api = client.BatchV1Api(get_api_client())
+    return await ensure_job(batch_api, spec, name, namespace, uid, logger)
+
+
+async def ensure_job(batch_api, spec, name, namespace, uid, logger) -> dict:
+    """Create the Job for a PaymentJob unless it exists, returning the status patch."""
     
     job_name = get_job_name(name, namespace)
     
     # Check if Job already exists (idempotency)
     try:
-        existing_job = batch_api.read_namespaced_job(job_name, namespace)
+        existing_job = await batch_api.read_namespaced_job(job_name, namespace)
         logger.info(f"Job {job_name} already exists, skipping creation")
         
         # Update status based on existing job
@@ -267,7 +342,7 @@ def create_paymentjob(spec, name, namespace, uid, logger, **kwargs):
     
     # Create the Job
     try:
-        batch_api.create_namespaced_job(namespace, job)
+        await batch_api.create_namespaced_job(namespace, job)
         logger.info(f"Created Job: {job_name}")
         
         # Update PaymentJob status
@@ -295,99 +370,249 @@ def create_paymentjob(spec, name, namespace, uid, logger, **kwargs):
 
 
 @kopf.on.delete(API_GROUP, API_VERSION, PLURAL)
-def delete_paymentjob(name, namespace, logger, **kwargs):
+async def delete_paymentjob(name, namespace, logger, **kwargs):
     """Handle PaymentJob deletion - Job will be garbage collected via ownerReferences."""
     logger.info(f"PaymentJob {namespace}/{name} deleted - Job will be garbage collected")
     
-    # The Job will be automatically deleted due to ownerReferences
-    # No explicit action needed
+    # The Job will be automatically deleted due to ownerReferences,
+    # only the recorded phase needs to be forgotten
+    _PAYMENTJOB_PHASES.pop((namespace, name), None)
 
 
-@kopf.timer(API_GROUP, API_VERSION, PLURAL, interval=10.0, sharp=True)
-def monitor_job_status(spec, name, namespace, status, logger, patch, **kwargs):
-    """Periodically monitor the Job status and update PaymentJob status."""
-    
-    job_name = status.get('jobName') if status else None
-    if not job_name:
-        job_name = get_job_name(name, namespace)
-    
-    # Load kubernetes config
-    try:
-        kubernetes.config.load_incluster_config()
-    except kubernetes.config.ConfigException:
-        kubernetes.config.load_kube_config()
+def get_job_phase(job_status: dict) -> tuple:
+    """Derive the PaymentJob phase and status message from a Job status.
+    
+    A phase is only terminal once the Job itself has finished, i.e. reports a
+    Complete or Failed condition. Failed pods alone don't fail the PaymentJob,
+    since the Job keeps retrying them until its backoffLimit is reached.
+    """
+    for condition in job_status.get('conditions') or []:
+        if condition.get('status') != 'True':
+            continue
+        if condition.get('type') == 'Complete':
+            return 'Succeeded', 'Job completed successfully'
+        if condition.get('type') == 'Failed':
+            return 'Failed', condition.get('message') or 'Job failed'
+    
+    active = job_status.get('active')
+    failed = job_status.get('failed')
+    
+    if failed and failed > 0:
+        return 'Running', f'Job is retrying after {failed} failed attempt(s)'
+    
+    if active and active > 0:
+        return 'Running', f'Job is running ({active} active pod(s))'
+    
+    return 'Pending', 'Waiting for pod to start'
+
+
+async def sync_paymentjob_status(
+    namespace: str,
+    name: str,
+    job_name: str,
+    job_status: dict
+) -> str:
+    """Patch the PaymentJob status from an observed Job status.
     
-    batch_api = client.BatchV1Api()
+    Returns the PaymentJob phase in effect afterwards, or None if the
+    PaymentJob no longer exists.
+    """
+    custom_api = client.CustomObjectsApi(get_api_client())
     
     try:
-        job = batch_api.read_namespaced_job(job_name, namespace)
+        paymentjob = await custom_api.get_namespaced_custom_object(
+            API_GROUP, API_VERSION, namespace, PLURAL, name
+        )
     except ApiException as e:
         if e.status == 404:
-            # Job doesn't exist yet or was deleted
-            logger.debug(f"Job {job_name} not found")
-            return
+            # PaymentJob was deleted, the Job will be garbage collected
+            logger.debug(f"PaymentJob {namespace}/{name} not found")
+            return None
         raise
     
-    # Determine phase from Job status
-    job_status = job.status
-    current_phase = status.get('phase', 'Pending') if status else 'Pending'
-    new_phase = current_phase
-    message = None
-    
-    if job_status.succeeded and job_status.succeeded > 0:
-        new_phase = 'Succeeded'
-        message = f'Job completed successfully'
-    elif job_status.failed and job_status.failed > 0:
-        new_phase = 'Failed'
-        # Try to get failure reason
-        if job_status.conditions:
-            for condition in job_status.conditions:
-                if condition.type == 'Failed' and condition.status == 'True':
-                    message = condition.message or 'Job failed'
-                    break
-        if not message:
-            message = f'Job failed after {job_status.failed} attempt(s)'
-    elif job_status.active and job_status.active > 0:
-        new_phase = 'Running'
-        message = f'Job is running ({job_status.active} active pod(s))'
-    else:
-        new_phase = 'Pending'
-        message = 'Waiting for pod to start'
+    status = paymentjob.get('status') or {}
+    current_phase = status.get('phase', 'Pending')
+    new_phase, message = get_job_phase(job_status)
     
     # Only update if phase changed
-    if new_phase != current_phase:
-        logger.info(f"PaymentJob {namespace}/{name} phase: {current_phase} -> {new_phase}")
-        
-        patch.status['phase'] = new_phase
-        patch.status['lastUpdateTime'] = get_current_timestamp()
-        patch.status['jobName'] = job_name
+    if new_phase == current_phase:
+        return current_phase
+    
+    logger.info(f"PaymentJob {namespace}/{name} phase: {current_phase} -> {new_phase}")
+    
+    now = get_current_timestamp()
+    status_patch = {
+        'phase': new_phase,
+        'lastUpdateTime': now,
+        'jobName': job_name,
+        'message': message
+    }
+    
+    # Add timestamps for terminal phases
+    if new_phase == 'Running' and not status.get('startTime'):
+        status_patch['startTime'] = now
+    elif new_phase in ('Succeeded', 'Failed'):
+        status_patch['completionTime'] = now
+    
+    await custom_api.patch_namespaced_custom_object_status(
+        API_GROUP, API_VERSION, namespace, PLURAL, name,
+        {'status': status_patch},
+        _content_type='application/merge-patch+json'
+    )
+    
+    # Post events for phase transitions
+    if new_phase == 'Succeeded':
+        kopf.info(
+            paymentjob,
+            reason='JobSucceeded',
+            message=f'Job {job_name} completed successfully'
+        )
+    elif new_phase == 'Failed':
+        kopf.warn(
+            paymentjob,
+            reason='JobFailed',
+            message=message or f'Job {job_name} failed'
+        )
+    
+    return new_phase
+
+
+def schedule_status_sync(
+    namespace: str,
+    name: str,
+    job_name: str,
+    job_status: dict
+):
+    """Record the latest Job status and schedule a debounced status sync."""
+    key = (namespace, name)
+    _LATEST_JOB_STATUS[key] = (job_name, job_status)
+    
+    # Coalesce rapid successive Job updates into a single PaymentJob patch;
+    # a running sync picks up the new snapshot once its patch completes
+    if key not in _PENDING_SYNCS:
+        _PENDING_SYNCS[key] = asyncio.create_task(
+            _run_status_sync(namespace, name)
+        )
+
+
+async def _run_status_sync(namespace: str, name: str):
+    """Sync a PaymentJob's status until no newer Job snapshot is pending.
+    
+    Only one sync runs per PaymentJob at a time, so patches are applied in
+    the order the Job statuses were observed. Failed syncs are retried with
+    backoff, since a finished Job sends no further events. The resulting
+    PaymentJob phase is recorded in _PAYMENTJOB_PHASES, whichever path
+    scheduled the sync.
+    """
+    key = (namespace, name)
+    retry_delay = STATUS_DEBOUNCE_SECONDS
+    
+    try:
+        await asyncio.sleep(STATUS_DEBOUNCE_SECONDS)
         
-        if message:
-            patch.status['message'] = message
+        while key in _LATEST_JOB_STATUS:
+            job_name, job_status = _LATEST_JOB_STATUS.pop(key)
+            try:
+                phase = await sync_paymentjob_status(namespace, name, job_name, job_status)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(
+                    f"Failed to sync PaymentJob {namespace}/{name} status: {e}. "
+                    f"Retrying in {retry_delay}s..."
+                )
+                # Retry with this snapshot unless a newer one arrived meanwhile
+                _LATEST_JOB_STATUS.setdefault(key, (job_name, job_status))
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, STATUS_RETRY_MAX_SECONDS)
+            else:
+                retry_delay = STATUS_DEBOUNCE_SECONDS
+                if phase is None:
+                    _PAYMENTJOB_PHASES.pop(key, None)
+                else:
+                    _PAYMENTJOB_PHASES[key] = phase
+    finally:
+        _PENDING_SYNCS.pop(key, None)
+
+
+@kopf.on.event('batch', 'v1', 'jobs', labels={'managed-by': 'paymentjob-operator'})
+async def monitor_job_status(type, body, namespace, labels, memo, logger, **kwargs):
+    """Watch managed Jobs and propagate their status to the owning PaymentJob."""
+    
+    if type == 'DELETED':
+        # Job was garbage collected or removed, nothing to report
+        return
+    
+    paymentjob_name = labels.get('paymentjob')
+    if not paymentjob_name:
+        return
+    
+    # The owning PaymentJob already reached a terminal phase, nothing to report
+    if _PAYMENTJOB_PHASES.get((namespace, paymentjob_name)) in TERMINAL_PHASES:
+        return
+    
+    # Skip events that don't change the counters or conditions the phase derives from
+    job_status = body.get('status') or {}
+    observed = (
+        job_status.get('succeeded'),
+        job_status.get('failed'),
+        job_status.get('active'),
+        tuple(
+            (condition.get('type'), condition.get('status'))
+            for condition in job_status.get('conditions') or []
+        )
+    )
+    if memo.get('last_job_status') == observed:
+        return
+    memo['last_job_status'] = observed
+    
+    schedule_status_sync(
+        namespace, paymentjob_name, body['metadata']['name'], dict(job_status)
+    )
+
+
+def is_unfinished(status, **_) -> bool:
+    """Filter PaymentJobs that have not reached a terminal phase yet."""
+    return status.get('phase') not in TERMINAL_PHASES
+
+
+@kopf.daemon(
+    API_GROUP, API_VERSION, PLURAL,
+    initial_delay=RESYNC_INTERVAL_SECONDS,
+    when=is_unfinished
+)
+async def resync_paymentjob(name, namespace, status, stopped, logger, **kwargs):
+    """Re-read the Job of an unfinished PaymentJob in case an event was missed.
+    
+    Terminal PaymentJobs never start a resync (and a running one exits once the
+    phase becomes terminal), so completed PaymentJobs cost no API calls at all.
+    The PaymentJob itself is only re-read when its Job implies a new phase.
+    """
+    batch_api = client.BatchV1Api(get_api_client())
+    
+    while not stopped:
+        if status.get('phase') in TERMINAL_PHASES:
+            logger.debug(f"PaymentJob {namespace}/{name} is {status.get('phase')}, stopping resync")
+            return
         
-        # Add timestamps for terminal phases
-        if new_phase == 'Running' and not (status and status.get('startTime')):
-            patch.status['startTime'] = get_current_timestamp()
-        elif new_phase in ('Succeeded', 'Failed'):
-            patch.status['completionTime'] = get_current_timestamp()
+        job_name = status.get('jobName') or get_job_name(name, namespace)
+        try:
+            job = await batch_api.read_namespaced_job(job_name, namespace)
+        except ApiException as e:
+            if e.status != 404:
+                raise
+            # Job doesn't exist yet or was deleted
+            logger.debug(f"Job {job_name} not found")
+        else:
+            job_status = get_api_client().sanitize_for_serialization(job.status) or {}
+            if get_job_phase(job_status)[0] != status.get('phase', 'Pending'):
+                schedule_status_sync(namespace, name, job_name, job_status)
         
-        # Post events for phase transitions
-        if new_phase == 'Succeeded':
-            kopf.info(
-                {'apiVersion': f'{API_GROUP}/{API_VERSION}', 'kind': 'PaymentJob'},
-                reason='JobSucceeded',
-                message=f'Job {job_name} completed successfully'
-            )
-        elif new_phase == 'Failed':
-            kopf.warn(
-                {'apiVersion': f'{API_GROUP}/{API_VERSION}', 'kind': 'PaymentJob'},
-                reason='JobFailed',
-                message=message or f'Job {job_name} failed'
-            )
+        await stopped.wait(RESYNC_INTERVAL_SECONDS)
 
 
 @kopf.on.update(API_GROUP, API_VERSION, PLURAL, field='spec')
-def update_paymentjob(old, new, name, namespace, logger, **kwargs):
+async def update_paymentjob(old, new, name, namespace, logger, **kwargs):
     """Handle PaymentJob spec updates."""
     logger.info(f"PaymentJob {namespace}/{name} spec updated")
     
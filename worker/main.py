@@ -3,16 +3,18 @@
 Payment Worker - Consumes messages from RabbitMQ and persists to PostgreSQL.
 """
 
-import json
+import asyncio
 import logging
 import os
+import signal
 import sys
 import time
 from datetime import datetime
 
-import pika
-import psycopg2
-from psycopg2.extras import Json
+import aio_pika
+import asyncpg
+import orjson
+from aio_pika.abc import AbstractIncomingMessage
 
 # Configure logging
 logging.basicConfig(
@@ -46,27 +48,63 @@ QUEUE_NAME = get_env('QUEUE_NAME', 'payments')
 MAX_MESSAGES = os.environ.get('MAX_MESSAGES')
 if MAX_MESSAGES:
     MAX_MESSAGES = int(MAX_MESSAGES)
+BATCH_SIZE = int(get_env('BATCH_SIZE', '100'))
+FLUSH_INTERVAL = float(get_env('FLUSH_INTERVAL', '1.0'))
+REQUEUE_DELAY = float(get_env('REQUEUE_DELAY', '1.0'))
+POSTGRES_POOL_MIN_SIZE = int(get_env('POSTGRES_POOL_MIN_SIZE', '4'))
+POSTGRES_POOL_MAX_SIZE = int(get_env('POSTGRES_POOL_MAX_SIZE', '16'))
+# Payments are independent, so delivery order is not preserved. Unacked
+# messages bound the work in flight: the default allows one full batch per
+# pooled connection (16 x 100 = 1600 with the defaults), capped at
+# MAX_PREFETCH_COUNT for very large pools or batches
+MAX_PREFETCH_COUNT = 5000
+PREFETCH_COUNT = int(get_env(
+    'PREFETCH_COUNT',
+    str(min(MAX_PREFETCH_COUNT, max(50, POSTGRES_POOL_MAX_SIZE * BATCH_SIZE)))
+))
 
+# Throughput summary is logged after this many messages or seconds
+LOG_EVERY_MESSAGES = 1000
+LOG_INTERVAL = 5.0
 
-def get_postgres_connection():
-    """Create and return a PostgreSQL connection."""
-    logger.info(f"Connecting to PostgreSQL at {POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}")
-    conn = psycopg2.connect(
-        host=POSTGRES_HOST,
-        port=POSTGRES_PORT,
-        dbname=POSTGRES_DB,
-        user=POSTGRES_USER,
-        password=POSTGRES_PASS
-    )
-    return conn
+# Columns populated for each payment, in record order
+PAYMENT_COLUMNS = ['received_at', 'payload', 'message_id', 'source_queue']
 
 
-def run_migrations(conn):
+async def create_postgres_pool():
+    """Create and return a PostgreSQL connection pool with retries."""
+    max_retries = 10
+    retry_delay = 5
+    
+    for attempt in range(1, max_retries + 1):
+        try:
+            logger.info(f"Connecting to PostgreSQL at {POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB} (attempt {attempt}/{max_retries})")
+            pool = await asyncpg.create_pool(
+                host=POSTGRES_HOST,
+                port=POSTGRES_PORT,
+                database=POSTGRES_DB,
+                user=POSTGRES_USER,
+                password=POSTGRES_PASS,
+                min_size=POSTGRES_POOL_MIN_SIZE,
+                max_size=POSTGRES_POOL_MAX_SIZE
+            )
+            logger.info("Successfully connected to PostgreSQL")
+            return pool
+        except (OSError, asyncpg.PostgresError) as e:
+            if attempt < max_retries:
+                logger.warning(f"Failed to connect to PostgreSQL: {e}. Retrying in {retry_delay}s...")
+                await asyncio.sleep(retry_delay)
+            else:
+                logger.error(f"Failed to connect to PostgreSQL after {max_retries} attempts")
+                raise
+
+
+async def run_migrations(pool):
     """Run database migrations - create payments table if not exists."""
     logger.info("Running database migrations...")
     create_table_sql = """
     CREATE TABLE IF NOT EXISTS payments (
-        id SERIAL PRIMARY KEY,
+        id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
         received_at TIMESTAMP NOT NULL DEFAULT NOW(),
         payload JSONB NOT NULL,
         message_id TEXT,
@@ -76,195 +114,316 @@ def run_migrations(conn):
     CREATE INDEX IF NOT EXISTS idx_payments_received_at ON payments(received_at);
     CREATE INDEX IF NOT EXISTS idx_payments_message_id ON payments(message_id);
     """
-    with conn.cursor() as cur:
-        cur.execute(create_table_sql)
-    conn.commit()
+    async with pool.acquire() as conn:
+        await conn.execute(create_table_sql)
     logger.info("Database migrations completed successfully")
 
 
-def insert_payment(conn, payload: dict, message_id: str, source_queue: str) -> int:
-    """Insert a payment record into the database."""
-    insert_sql = """
-    INSERT INTO payments (received_at, payload, message_id, source_queue)
-    VALUES (%s, %s, %s, %s)
-    RETURNING id;
+async def insert_payments(conn, payments: list, source_queue: str) -> int:
+    """Bulk load a batch of payment records with binary COPY.
+    
+    Each item of ``payments`` is a ``(received_at, payload_json, message_id)``
+    tuple, where ``payload_json`` is the raw JSON text of the message body.
+    COPY bypasses statement parsing and planning entirely, and asyncpg's
+    JSONB codec sends the text as-is, so the payload is never re-serialized.
+    The column introspection statement asyncpg issues for the COPY is
+    prepared once per pooled connection and served from its statement cache.
     """
-    with conn.cursor() as cur:
-        cur.execute(insert_sql, (
-            datetime.utcnow(),
-            Json(payload),
-            message_id,
-            source_queue
-        ))
-        payment_id = cur.fetchone()[0]
-    conn.commit()
-    return payment_id
+    records = [
+        (received_at, payload_json, message_id, source_queue)
+        for received_at, payload_json, message_id in payments
+    ]
+    await conn.copy_records_to_table(
+        'payments',
+        records=records,
+        columns=PAYMENT_COLUMNS
+    )
+    return len(records)
 
 
-def get_rabbitmq_connection():
+async def get_rabbitmq_connection():
     """Create and return a RabbitMQ connection with retries."""
-    credentials = pika.PlainCredentials(RABBITMQ_USER, RABBITMQ_PASS)
-    parameters = pika.ConnectionParameters(
-        host=RABBITMQ_HOST,
-        port=RABBITMQ_PORT,
-        credentials=credentials,
-        heartbeat=600,
-        blocked_connection_timeout=300
-    )
-    
     max_retries = 10
     retry_delay = 5
     
     for attempt in range(1, max_retries + 1):
         try:
             logger.info(f"Connecting to RabbitMQ at {RABBITMQ_HOST}:{RABBITMQ_PORT} (attempt {attempt}/{max_retries})")
-            connection = pika.BlockingConnection(parameters)
+            connection = await aio_pika.connect_robust(
+                host=RABBITMQ_HOST,
+                port=RABBITMQ_PORT,
+                login=RABBITMQ_USER,
+                password=RABBITMQ_PASS,
+                heartbeat=600
+            )
             logger.info("Successfully connected to RabbitMQ")
             return connection
-        except pika.exceptions.AMQPConnectionError as e:
+        except (OSError, aio_pika.exceptions.AMQPConnectionError) as e:
             if attempt < max_retries:
                 logger.warning(f"Failed to connect to RabbitMQ: {e}. Retrying in {retry_delay}s...")
-                time.sleep(retry_delay)
+                await asyncio.sleep(retry_delay)
             else:
                 logger.error(f"Failed to connect to RabbitMQ after {max_retries} attempts")
                 raise
 
 
 class PaymentWorker:
-    """Worker that consumes messages from RabbitMQ and persists to PostgreSQL."""
+    """Worker that consumes messages from RabbitMQ and persists to PostgreSQL.
+    
+    Messages are accumulated into batches which are inserted by background
+    tasks. In-flight work is bounded by PREFETCH_COUNT unacknowledged messages,
+    not by a number of batches: FLUSH_INTERVAL may flush partial batches, so
+    more than PREFETCH_COUNT // BATCH_SIZE of them can be pending. Batches
+    beyond POSTGRES_POOL_MAX_SIZE wait for a free connection.
+    """
     
     def __init__(self):
-        self.pg_conn = None
+        self.pg_pool = None
         self.rmq_conn = None
         self.channel = None
+        self.queue = None
+        self.consumer_tag = None
         self.messages_processed = 0
+        self.messages_accepted = 0
+        self.batch = []
+        self.flush_timer = None
+        self.in_flight = set()
+        self.stopped = asyncio.Event()
+        self.last_log_time = time.monotonic()
+        self.last_log_count = 0
         
-    def setup(self):
+    async def setup(self):
         """Initialize connections and run migrations."""
-        # Connect to PostgreSQL with retries
-        max_retries = 10
-        retry_delay = 5
-        
-        for attempt in range(1, max_retries + 1):
-            try:
-                logger.info(f"Connecting to PostgreSQL (attempt {attempt}/{max_retries})")
-                self.pg_conn = get_postgres_connection()
-                logger.info("Successfully connected to PostgreSQL")
-                break
-            except psycopg2.OperationalError as e:
-                if attempt < max_retries:
-                    logger.warning(f"Failed to connect to PostgreSQL: {e}. Retrying in {retry_delay}s...")
-                    time.sleep(retry_delay)
-                else:
-                    logger.error(f"Failed to connect to PostgreSQL after {max_retries} attempts")
-                    raise
+        # Connect to PostgreSQL
+        self.pg_pool = await create_postgres_pool()
         
         # Run migrations
-        run_migrations(self.pg_conn)
+        await run_migrations(self.pg_pool)
         
         # Connect to RabbitMQ
-        self.rmq_conn = get_rabbitmq_connection()
-        self.channel = self.rmq_conn.channel()
+        self.rmq_conn = await get_rabbitmq_connection()
+        self.channel = await self.rmq_conn.channel()
         
-        # Declare queue (idempotent)
-        self.channel.queue_declare(queue=QUEUE_NAME, durable=True)
+        # Prefetch enough messages to fill a batch, but never more than we will consume
+        prefetch_count = PREFETCH_COUNT
+        if MAX_MESSAGES:
+            prefetch_count = min(prefetch_count, MAX_MESSAGES)
+        await self.channel.set_qos(prefetch_count=prefetch_count)
         
-        # Set prefetch to 1 for fair dispatch
-        self.channel.basic_qos(prefetch_count=1)
+        # Declare queue (idempotent)
+        self.queue = await self.channel.declare_queue(QUEUE_NAME, durable=True)
         
         logger.info(f"Worker setup complete. Listening on queue: {QUEUE_NAME}")
     
-    def process_message(self, ch, method, properties, body):
-        """Process a single message from the queue."""
-        message_id = properties.message_id if properties.message_id else None
-        delivery_tag = method.delivery_tag
+    async def process_message(self, message: AbstractIncomingMessage):
+        """Parse a message and add it to the pending batch."""
+        message_id = message.message_id
+        delivery_tag = message.delivery_tag
+        
+        if MAX_MESSAGES and self.messages_accepted >= MAX_MESSAGES:
+            # Already have enough messages for this run, hand it back
+            await message.nack(requeue=True)
+            return
         
-        logger.info(f"Received message (delivery_tag={delivery_tag}, message_id={message_id})")
+        logger.debug("Received message (delivery_tag=%s, message_id=%s)", delivery_tag, message_id)
+        
+        # Validate JSON payload; the raw body is what gets stored
+        try:
+            payload = orjson.loads(message.body)
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Invalid JSON in message: {e}")
+            # Reject message without requeue for invalid JSON
+            await message.reject(requeue=False)
+            return
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            transaction_id = payload.get('transaction_id') if isinstance(payload, dict) else None
+            logger.debug("Processing payload (transaction_id=%s)", transaction_id)
+        
+        self.batch.append((message, (datetime.utcnow(), message.body.decode('utf-8'), message_id)))
+        self.messages_accepted += 1
+        
+        limit_reached = bool(MAX_MESSAGES and self.messages_accepted >= MAX_MESSAGES)
+        if len(self.batch) >= BATCH_SIZE or limit_reached:
+            self.flush()
+        elif self.flush_timer is None:
+            self.flush_timer = asyncio.get_running_loop().call_later(FLUSH_INTERVAL, self.flush)
+    
+    def flush(self):
+        """Hand the pending batch off to a background insert task."""
+        if self.flush_timer is not None:
+            self.flush_timer.cancel()
+            self.flush_timer = None
+        
+        if not self.batch:
+            return
+        
+        batch, self.batch = self.batch, []
+        task = asyncio.create_task(self.write_batch(batch))
+        self.in_flight.add(task)
+        task.add_done_callback(self.in_flight.discard)
+    
+    async def write_batch(self, batch: list):
+        """Insert a batch in one transaction, then ACK or requeue its messages.
+        
+        Messages are acknowledged individually rather than with multiple=True,
+        since batches complete out of order and a cumulative ACK could cover
+        messages from another batch that has not been committed yet.
+        """
+        messages = [message for message, _ in batch]
+        rows = [row for _, row in batch]
+        batch_size = len(batch)
         
         try:
-            # Parse JSON payload
-            try:
-                payload = json.loads(body.decode('utf-8'))
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON in message: {e}")
-                # Reject message without requeue for invalid JSON
-                ch.basic_nack(delivery_tag=delivery_tag, requeue=False)
-                return
-            
-            logger.info(f"Processing payload: {json.dumps(payload)[:200]}...")
-            
             # Insert into PostgreSQL
-            payment_id = insert_payment(
-                self.pg_conn,
-                payload,
-                message_id,
-                QUEUE_NAME
-            )
-            
-            logger.info(f"Successfully inserted payment with id={payment_id}")
-            
-            # ACK the message only after successful insert
-            ch.basic_ack(delivery_tag=delivery_tag)
-            logger.info(f"Message acknowledged (delivery_tag={delivery_tag})")
-            
-            self.messages_processed += 1
-            
-            # Check if we've reached MAX_MESSAGES limit
-            if MAX_MESSAGES and self.messages_processed >= MAX_MESSAGES:
-                logger.info(f"Reached MAX_MESSAGES limit ({MAX_MESSAGES}). Stopping worker.")
-                ch.stop_consuming()
-                
-        except psycopg2.Error as e:
-            logger.error(f"Database error: {e}")
-            # Don't ACK - message will be requeued
-            ch.basic_nack(delivery_tag=delivery_tag, requeue=True)
-            logger.warning(f"Message will be requeued (delivery_tag={delivery_tag})")
+            async with self.pg_pool.acquire() as conn:
+                try:
+                    await insert_payments(conn, rows, QUEUE_NAME)
+                except asyncpg.DataError as e:
+                    # Some row is unacceptable (e.g. \u0000 in JSONB); isolate it
+                    logger.warning(f"Batch rejected by PostgreSQL: {e}. Inserting {batch_size} payment(s) one by one")
+                    await self.write_rows_individually(conn, batch)
+                    return
+            logger.debug("Successfully inserted %s payment(s)", batch_size)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if isinstance(e, asyncpg.PostgresError):
+                logger.error(f"Database error: {e}")
+            else:
+                logger.error(f"Unexpected error processing batch: {e}")
             
-            # Try to reconnect to PostgreSQL
+            # Don't ACK - the whole batch will be requeued
+            await self.requeue(messages)
+            return
+        
+        # ACK the messages only after successful insert
+        await self.acknowledge(messages)
+    
+    async def write_rows_individually(self, conn, batch: list):
+        """Insert a batch row by row, rejecting only the rows PostgreSQL refuses."""
+        for index, (message, row) in enumerate(batch):
             try:
-                self.pg_conn = get_postgres_connection()
-                logger.info("Reconnected to PostgreSQL")
-            except Exception as reconnect_error:
-                logger.error(f"Failed to reconnect to PostgreSQL: {reconnect_error}")
-                
+                await insert_payments(conn, [row], QUEUE_NAME)
+            except asyncpg.DataError as e:
+                logger.error(f"Payment rejected by PostgreSQL (message_id={message.message_id}): {e}")
+                # Reject message without requeue, it can never be inserted
+                self.messages_accepted -= 1
+                try:
+                    await message.reject(requeue=False)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as reject_error:
+                    logger.error(f"Failed to reject message: {reject_error}")
+                continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Database error: {e}")
+                await self.requeue([message for message, _ in batch[index:]])
+                return
+            
+            await self.acknowledge([message])
+    
+    async def requeue(self, messages: list):
+        """Hand messages back to the broker after a short delay."""
+        self.messages_accepted -= len(messages)
+        
+        # Give the database a moment to recover before the messages come back
+        await asyncio.sleep(REQUEUE_DELAY)
+        try:
+            for message in messages:
+                await message.nack(requeue=True)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to requeue {len(messages)} message(s): {e}")
+            return
+        logger.warning(f"Batch of {len(messages)} message(s) will be requeued")
+    
+    async def acknowledge(self, messages: list):
+        """ACK messages whose rows are committed and count them as processed.
+        
+        The rows are already in PostgreSQL at this point, so they are counted
+        even if the ACKs fail (e.g. the channel was re-established by
+        connect_robust); the broker will then redeliver them as duplicates.
+        """
+        try:
+            for message in messages:
+                await message.ack()
+            logger.debug("Batch of %s message(s) acknowledged", len(messages))
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            logger.error(f"Unexpected error processing message: {e}")
-            ch.basic_nack(delivery_tag=delivery_tag, requeue=True)
-            logger.warning(f"Message will be requeued (delivery_tag={delivery_tag})")
+            logger.error(f"Failed to acknowledge committed batch of {len(messages)} message(s): {e}")
+        
+        self.messages_processed += len(messages)
+        self.log_progress()
+        
+        # Check if we've reached MAX_MESSAGES limit
+        if MAX_MESSAGES and self.messages_processed >= MAX_MESSAGES:
+            logger.info(f"Reached MAX_MESSAGES limit ({MAX_MESSAGES}). Stopping worker.")
+            self.stopped.set()
+    
+    def log_progress(self):
+        """Log a throughput summary every LOG_EVERY_MESSAGES or LOG_INTERVAL."""
+        now = time.monotonic()
+        count = self.messages_processed - self.last_log_count
+        elapsed = now - self.last_log_time
+        if count < LOG_EVERY_MESSAGES and elapsed < LOG_INTERVAL:
+            return
+        
+        rate = count / elapsed if elapsed > 0 else 0.0
+        logger.info("Processed %s messages, rate=%.1f/s", self.messages_processed, rate)
+        self.last_log_time = now
+        self.last_log_count = self.messages_processed
+    
+    def stop(self):
+        """Request a graceful shutdown."""
+        logger.info("Received shutdown signal")
+        self.stopped.set()
     
-    def run(self):
+    async def run(self):
         """Start consuming messages."""
         logger.info("Starting message consumption...")
         
-        self.channel.basic_consume(
-            queue=QUEUE_NAME,
-            on_message_callback=self.process_message,
-            auto_ack=False
-        )
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self.stop)
         
         try:
-            self.channel.start_consuming()
-        except KeyboardInterrupt:
-            logger.info("Received shutdown signal")
-            self.channel.stop_consuming()
+            self.consumer_tag = await self.queue.consume(self.process_message)
+            await self.stopped.wait()
         finally:
-            self.cleanup()
+            # Stop deliveries, then drain what is already batched or in flight
+            if self.consumer_tag is not None and not self.channel.is_closed:
+                await self.queue.cancel(self.consumer_tag)
+            self.flush()
+            if self.in_flight:
+                await asyncio.gather(*self.in_flight, return_exceptions=True)
+            await self.cleanup()
     
-    def cleanup(self):
+    async def cleanup(self):
         """Clean up connections."""
         logger.info("Cleaning up connections...")
         
-        if self.rmq_conn and self.rmq_conn.is_open:
-            self.rmq_conn.close()
+        if self.rmq_conn and not self.rmq_conn.is_closed:
+            await self.rmq_conn.close()
             logger.info("RabbitMQ connection closed")
             
-        if self.pg_conn and not self.pg_conn.closed:
-            self.pg_conn.close()
-            logger.info("PostgreSQL connection closed")
+        if self.pg_pool:
+            await self.pg_pool.close()
+            logger.info("PostgreSQL connection pool closed")
         
         logger.info(f"Worker finished. Total messages processed: {self.messages_processed}")
 
 
+async def run_worker(worker: PaymentWorker):
+    """Set up the worker and consume until it stops."""
+    await worker.setup()
+    await worker.run()
+
+
 def main():
     """Main entry point."""
     logger.info("=" * 60)
@@ -275,13 +434,14 @@ def main():
     logger.info(f"  PostgreSQL: {POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}")
     logger.info(f"  Queue: {QUEUE_NAME}")
     logger.info(f"  Max Messages: {MAX_MESSAGES if MAX_MESSAGES else 'unlimited'}")
+    logger.info(f"  Batch Size: {BATCH_SIZE} (flush every {FLUSH_INTERVAL}s)")
+    logger.info(f"  Prefetch: {PREFETCH_COUNT}, PostgreSQL pool: {POSTGRES_POOL_MIN_SIZE}-{POSTGRES_POOL_MAX_SIZE}")
     logger.info("=" * 60)
     
     worker = PaymentWorker()
     
     try:
-        worker.setup()
-        worker.run()
+        asyncio.run(run_worker(worker))
     except Exception as e:
         logger.error(f"Fatal error: {e}")
         sys.exit(1)